@@ -0,0 +1,87 @@
+"""
+Run the trainer callbacks from train_yolov8n.py against a stub trainer
+Registration order and the preprocess_batch wrapping chain are the real ones;
+CUDA is faked so the GPU-only callbacks are registered on a CPU host.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "workspace"))
+import train_yolov8n  # noqa: E402
+
+
+class StubModel:
+    """Collects callbacks the way YOLO.add_callback does"""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def add_callback(self, event, func):
+        self.callbacks.setdefault(event, []).append(func)
+
+    def run(self, event, trainer):
+        for func in self.callbacks.get(event, []):
+            func(trainer)
+
+
+def make_trainer():
+    net = torch.nn.Sequential(torch.nn.Conv2d(3, 4, 3), torch.nn.BatchNorm2d(4))
+    optimizer = torch.optim.SGD(net.parameters(), lr=0.01)
+    for group in optimizer.param_groups:
+        group["initial_lr"] = group["lr"]
+    trainer = SimpleNamespace(
+        model=net,
+        device=torch.device("cpu"),
+        batch_size=2,
+        args=SimpleNamespace(imgsz=32),
+        amp=False,
+        optimizer=optimizer,
+        scheduler=torch.optim.lr_scheduler.LambdaLR(optimizer, lambda epoch: 1.0),
+        save_model=lambda: None,
+        final_eval=lambda: None,
+    )
+    # Same as DetectionTrainer.preprocess_batch in Ultralytics 8.1
+    trainer.preprocess_batch = lambda batch: {
+        **batch, "img": batch["img"].to(trainer.device, non_blocking=True).float() / 255}
+    return trainer
+
+
+@pytest.fixture
+def fake_cuda(monkeypatch):
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    monkeypatch.setattr(torch.cuda, "get_device_capability", lambda *args: (8, 0))
+    monkeypatch.setattr(torch.cuda, "synchronize", lambda *args: None)
+
+
+def test_pretrain_callbacks_run_in_registration_order(fake_cuda):
+    model = StubModel()
+    train_yolov8n.add_training_callbacks(model, nbs=64)
+    trainer = make_trainer()
+
+    # The cuDNN warmup feeds an img-only batch through every preprocess_batch wrapper
+    model.run("on_pretrain_routine_end", trainer)
+    assert trainer.model.training
+
+    batch = trainer.preprocess_batch({
+        "img": torch.zeros(2, 3, 32, 32, dtype=torch.uint8),
+        "cls": torch.zeros(3, 1),
+        "bboxes": torch.zeros(3, 4),
+        "batch_idx": torch.tensor([0.0, 0.0, 1.0]),
+    })
+    assert batch["img"].dtype == torch.float32
+    assert batch["img"].is_contiguous(memory_format=torch.channels_last)
+    assert batch["cls"].device == trainer.device
+
+
+def test_deterministic_skips_warmup(fake_cuda):
+    model = StubModel()
+    train_yolov8n.add_training_callbacks(model, nbs=64, deterministic=True)
+    names = [f.__qualname__.split(".")[0] for f in model.callbacks["on_pretrain_routine_end"]]
+    assert "add_cudnn_warmup_callback" not in names
+    assert names[-1] == "add_batch_lr_callback"
@@ -3,17 +3,21 @@
 YOLOv8 ONNX → K230D .kmodel (nncase 2.9.0). Self-contained; does not import convert_to_kmodel2.
 
 K230D calibration (ai2d / KPU path):
-  Float32 with pixel values in [0, 255] and **no** /255 normalization is required so the
-  deployed model matches how the K230D **ai2d** block feeds the KPU (hardware preprocessing).
-  nncase PTQ also expects float32 tensors aligned with the ONNX graph input (f32), not uint8.
+  Calibration tensors are uint8 with pixel values in [0, 255] and **no** /255 on the host so
+  the deployed model matches how the K230D **ai2d** block feeds the KPU (hardware preprocessing).
+  The /255 is folded into the model by the compiler (preprocess=True, mean=0, std=255), so the
+  kmodel accepts raw uint8 frames and calibration needs 1/4 the memory of float32.
 
-  (K230D専用: float32 かつ /255 しない設定は、ai2d のハードウェア前処理と量子化後の実機挙動を一致させるために必須。)
+  (K230D専用: uint8 [0,255] のまま渡し、/255 はコンパイラ前処理 (std=255) に任せる。ai2d のハードウェア前処理と量子化後の実機挙動を一致させるために必須。)
 """
 
 import argparse
 import gc
+import mmap
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -68,21 +72,24 @@ def generate_calibration_data(
     dataset_path: str,
     img_height: int = 480,
     img_width: int = 640,
-    num_samples: int = 100,
+    num_samples: int = 300,
+    num_workers: int = None,
+    input_layout: str = "NCHW",
 ) -> list:
     """
-    Build PTQ calibration: float32 NCHW, values [0, 255], no /255 — matches K230D ai2d + ONNX f32.
+    Build PTQ calibration: uint8 NCHW (or NHWC), values [0, 255], no /255 — matches K230D ai2d uint8 input.
     """
     import cv2
     from glob import glob
 
     print(f"\n{'='*60}")
-    print(f"[CALIB] Generating calibration data (float32 [0,255], NO /255)  [K230D ai2d-compatible]")
+    print(f"[CALIB] Generating calibration data (uint8 [0,255], NO /255)  [K230D ai2d-compatible]")
     print(f"{'='*60}")
     print(f"[CALIB]   Source        : {dataset_path}")
     print(f"[CALIB]   Target size   : {img_width}x{img_height} (WxH)")
     print(f"[CALIB]   Max samples   : {num_samples}")
-    print(f"[CALIB]   Value range   : [0, 255] float32  (nncase PTQ + ONNX f32 input)")
+    print(f"[CALIB]   Value range   : [0, 255] uint8  (compiler preprocess applies /255)")
+    print(f"[CALIB]   Layout        : {input_layout}")
 
     image_files = []
     for ext in ["*.jpg", "*.jpeg", "*.png", "*.bmp", "*.webp"]:
@@ -95,70 +102,118 @@ def generate_calibration_data(
     image_files = sorted(image_files)[:num_samples]
     print(f"[CALIB]   Images found  : {len(image_files)}")
 
-    calibration_data = []
-    failed = 0
+    # One contiguous uint8 buffer for every sample; each calibration entry is a
+    # (1, C, H, W) / (1, H, W, C) view into it, so no per-image arrays are allocated.
+    nhwc = input_layout == "NHWC"
+    if nhwc:
+        buf = np.empty((len(image_files), img_height, img_width, 3), dtype=np.uint8)
+    else:
+        buf = np.empty((len(image_files), 3, img_height, img_width), dtype=np.uint8)
+    scratch = threading.local()
 
-    for idx, img_path in enumerate(image_files):
+    def _process_one(item):
+        # imread / resize release the GIL, so decoding overlaps across threads.
+        idx, img_path = item
         try:
-            img = cv2.imread(img_path)
+            img = cv2.imread(img_path, cv2.IMREAD_COLOR)
             if img is None:
-                print(f"[CALIB]   ⚠  Could not read: {img_path}")
-                failed += 1
-                continue
-
-            original_h, original_w = img.shape[:2]
-            img = cv2.resize(img, (img_width, img_height))
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+                return None, "Could not read"
+            if not hasattr(scratch, "resized"):
+                scratch.resized = np.empty((img_height, img_width, 3), dtype=np.uint8)
+            # Area averaging is the faster and cleaner choice when shrinking; bilinear otherwise
+            h, w = img.shape[:2]
+            interp = cv2.INTER_AREA if (h > img_height and w > img_width) else cv2.INTER_LINEAR
+            cv2.resize(img, (img_width, img_height), dst=scratch.resized, interpolation=interp)
+            # BGR -> RGB (and HWC -> CHW for NCHW) in a single strided copy into the buffer slot.
             # Hardware expects uint8 [0, 255]. Compiler preprocess handles 0-1 scaling internally.
-            img = img.astype(np.uint8)
-
-            img = np.transpose(img, (2, 0, 1))
-            img = np.expand_dims(img, axis=0)
+            if nhwc:
+                buf[idx] = scratch.resized[:, :, ::-1]
+            else:
+                buf[idx] = scratch.resized[:, :, ::-1].transpose(2, 0, 1)
+            return img.shape[:2], None
+        except Exception as exc:
+            return None, exc
 
-            if idx < 3:
-                print(f"\n[CALIB]   Sample {idx}: {os.path.basename(img_path)}")
-                print(f"[CALIB]     Original  : {original_w}x{original_h}")
-                print(f"[CALIB]     Shape     : {img.shape}  (NCHW)")
-                print(f"[CALIB]     dtype     : {img.dtype}")
-                print(f"[CALIB]     min/max   : {img.min():.0f} / {img.max():.0f}  ← should be ~0 / ~255")
-                print(f"[CALIB]     mean      : {img.mean():.1f}  ← should be ~100-150")
+    with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as ex:
+        results = list(ex.map(_process_one, enumerate(image_files), chunksize=4))
 
-            calibration_data.append(img)
+    loaded = 0
+    failed = 0
 
-        except Exception as exc:
-            print(f"[CALIB]   ⚠  Failed ({img_path}): {exc}")
+    for idx, (img_path, (original_hw, error)) in enumerate(zip(image_files, results)):
+        if original_hw is None:
+            if isinstance(error, str):
+                print(f"[CALIB]   ⚠  {error}: {img_path}")
+            else:
+                print(f"[CALIB]   ⚠  Failed ({img_path}): {error}")
             failed += 1
+            continue
+
+        # Compact successful samples to the front so the buffer stays gap-free.
+        if loaded != idx:
+            buf[loaded] = buf[idx]
+
+        if idx < 3:
+            original_h, original_w = original_hw
+            sample = buf[loaded]
+            print(f"\n[CALIB]   Sample {idx}: {os.path.basename(img_path)}")
+            print(f"[CALIB]     Original  : {original_w}x{original_h}")
+            print(f"[CALIB]     Shape     : {(1,) + sample.shape}  ({input_layout})")
+            print(f"[CALIB]     dtype     : {sample.dtype}")
+            print(f"[CALIB]     min/max   : {sample.min():.0f} / {sample.max():.0f}  ← should be ~0 / ~255")
+            print(f"[CALIB]     mean      : {sample.mean():.1f}  ← should be ~100-150")
+
+        loaded += 1
 
-    if not calibration_data:
+    if not loaded:
         raise ValueError("[CALIB] No calibration data could be generated.")
 
-    all_data = np.concatenate(calibration_data, axis=0)
+    all_data = buf[:loaded]
     print(f"\n[CALIB] ── Summary ──────────────────────────────────────")
-    print(f"[CALIB]   Loaded ok     : {len(calibration_data)}")
+    print(f"[CALIB]   Loaded ok     : {loaded}")
     print(f"[CALIB]   Failed        : {failed}")
-    print(f"[CALIB]   Batch shape   : {all_data.shape}  (N,C,H,W)")
+    print(f"[CALIB]   Batch shape   : {all_data.shape}  ({','.join(input_layout)})")
+    print(f"[CALIB]   Buffer size   : {all_data.nbytes/1024/1024:.1f} MB  (uint8, one contiguous block)")
     print(f"[CALIB]   dtype         : {all_data.dtype}")
     print(f"[CALIB]   Global min    : {all_data.min():.0f}  (expect ≈ 0)")
     print(f"[CALIB]   Global max    : {all_data.max():.0f}  (expect ≈ 255)")
     print(f"[CALIB]   Global mean   : {all_data.mean():.1f}  (expect ~100-150)")
     print(f"[CALIB] ────────────────────────────────────────────────────")
 
-    del all_data
-    return calibration_data
+    return [all_data[i:i + 1] for i in range(loaded)]
 
 
-def generate_random_calibration(img_height: int, img_width: int, n: int = 20) -> list:
+def generate_random_calibration(
+    img_height: int, img_width: int, n: int = 20, input_layout: str = "NCHW"
+) -> list:
     print(f"\n[CALIB] ⚠  Using RANDOM calibration data (not recommended for production)")
     print(f"[CALIB]   Samples : {n}")
     print(f"[CALIB]   Range   : [0, 255] uint8")
-    data = [
-        (np.random.randint(0, 256, (1, 3, img_height, img_width), dtype=np.uint8))
-        for _ in range(n)
-    ]
+    if input_layout == "NHWC":
+        shape = (1, img_height, img_width, 3)
+    else:
+        shape = (1, 3, img_height, img_width)
+    # One (n, 1, ...) block; each sample is a view into it
+    data = list(np.random.randint(0, 256, (n,) + shape, dtype=np.uint8))
     print(f"[CALIB]   Sample[0] min/max: {data[0].min():.0f} / {data[0].max():.0f}")
     return data
 
 
+def confirm_random_calibration() -> None:
+    """Ask before falling back to random calibration; raises ValueError unless confirmed"""
+    print("\n[CALIB] ⚠  No --calib-data provided.")
+    # Random tensors give Kld/NoClip meaningless activation ranges; never fall back
+    # to them silently (CI, docker run without -t).
+    if not sys.stdin.isatty():
+        raise ValueError(
+            "[CALIB] Calibration images are required in non-interactive mode "
+            "(random calibration ruins the quantization ranges). Pass --calib-data."
+        )
+    answer = input("[CALIB] Continue with RANDOM calibration data? [y/N]: ")
+    if answer.strip().lower() not in ("y", "yes"):
+        raise ValueError("[CALIB] Aborted: no calibration data.")
+
+
 def convert_to_kmodel(
     onnx_path: str,
     output_dir: str = "./output",
@@ -166,15 +221,21 @@ def convert_to_kmodel(
     img_height: int = 480,
     img_width: int = 640,
     target: str = "k230",
-    num_calibration_samples: int = 100,
+    num_calibration_samples: int = 300,
     quant_type: str = "uint8",
     w_quant_type: str = "uint8",
     calib_method: str = "Kld",
+    input_layout: str = "NCHW",
+    finetune_weights: bool = True,
+    calibration_data: list = None,
+    writer=None,
 ) -> str:
+    """Compile one ONNX model. convert_many() passes pre-loaded calibration_data (skips
+    loading the images again) and a writer(kmodel_path, kmodel_bytes) that saves in the background."""
 
     print(f"\n{'='*60}")
     print(f"  YOLOv8 → K230D kmodel  (nncase 2.9.0)  [convert_to_kmodel3]")
-    print(f"  Calibration: float32 [0,255] — NO /255 (matches ONNX f32 input)")
+    print(f"  Calibration: uint8 [0,255] — NO /255 (compiler preprocess, std=255)")
     print(f"{'='*60}")
 
     if not os.path.exists(onnx_path):
@@ -192,6 +253,8 @@ def convert_to_kmodel(
     print(f"[CONFIG] Act quant type  : {quant_type}")
     print(f"[CONFIG] Weight quant    : {w_quant_type}")
     print(f"[CONFIG] Calib method    : {calib_method}")
+    print(f"[CONFIG] Input layout    : {input_layout}")
+    print(f"[CONFIG] Finetune weights: {finetune_weights}")
     print(f"[CONFIG] Calib samples   : {num_calibration_samples}")
 
     verify_onnx_model(onnx_path, img_height, img_width)
@@ -206,16 +269,21 @@ def convert_to_kmodel(
             "  pip install nncase==2.9.0 nncase-kpu==2.9.0"
         )
 
-    if calibration_data_path:
+    if calibration_data is not None:
+        print(f"\n[CALIB] Reusing {len(calibration_data)} pre-loaded calibration samples")
+    elif calibration_data_path:
         calibration_data = generate_calibration_data(
             calibration_data_path,
             img_height=img_height,
             img_width=img_width,
             num_samples=num_calibration_samples,
+            input_layout=input_layout,
         )
     else:
-        print("\n[CALIB] ⚠  No --calib-data provided.")
-        calibration_data = generate_random_calibration(img_height, img_width, n=20)
+        confirm_random_calibration()
+        calibration_data = generate_random_calibration(
+            img_height, img_width, n=20, input_layout=input_layout
+        )
 
     print(f"\n{'='*60}")
     print(f"[COMPILE] Starting compilation...")
@@ -232,29 +300,40 @@ def convert_to_kmodel(
         compile_options.preprocess = True
         compile_options.swapRB = False
         compile_options.input_type = "uint8"
-        compile_options.input_shape = [1, 3, img_height, img_width]
-        compile_options.input_layout = "NCHW"
+        if input_layout == "NHWC":
+            # nncase inserts one transpose in front of the graph and fuses it into the first conv.
+            compile_options.input_shape = [1, img_height, img_width, 3]
+        else:
+            compile_options.input_shape = [1, 3, img_height, img_width]
+        compile_options.input_layout = input_layout
         compile_options.output_layout = "NCHW"
         compile_options.input_range = [0, 255]
         compile_options.mean = [0, 0, 0]
         compile_options.std = [255.0, 255.0, 255.0]
         
         print(f"[COMPILE] preprocess : {compile_options.preprocess}")
+        print(f"[COMPILE] input_type : {compile_options.input_type}  (mean={compile_options.mean}, std={compile_options.std})")
 
         ptq_options = nncase.PTQTensorOptions()
         ptq_options.quant_type = quant_type
         ptq_options.w_quant_type = w_quant_type
         ptq_options.calibrate_method = calib_method
-        ptq_options.finetune_weights_method = "NoFineTuneWeights"
+        # SQuant optimises weight rounding per layer: same uint8 kmodel, better accuracy.
+        # Costs roughly 2x compile time and benefits from 300-500 calibration samples.
+        ptq_options.finetune_weights_method = "UseSquant" if finetune_weights else "NoFineTuneWeights"
         ptq_options.samples_count = len(calibration_data)
 
         print(f"[COMPILE] ✓ PTQTensorOptions:")
         print(f"[COMPILE]     quant_type       : {ptq_options.quant_type}")
         print(f"[COMPILE]     w_quant_type     : {ptq_options.w_quant_type}")
         print(f"[COMPILE]     calibrate_method : {ptq_options.calibrate_method}")
+        print(f"[COMPILE]     finetune_weights : {ptq_options.finetune_weights_method}")
         print(f"[COMPILE]     samples_count    : {ptq_options.samples_count}")
+        if finetune_weights and ptq_options.samples_count < 300:
+            print(f"[COMPILE]   ⚠  Weight finetuning works best with 300-500 samples (--num-samples)")
 
         ptq_data = [[img] for img in calibration_data]
+        del calibration_data  # ptq_data now holds the only references to the sample views
         print(f"\n[COMPILE] Calibration tensor check:")
         print(f"[COMPILE]   ptq_data length    : {len(ptq_data)}")
         print(f"[COMPILE]   sample shape       : {ptq_data[0][0].shape}")
@@ -262,6 +341,10 @@ def convert_to_kmodel(
         print(
             f"[COMPILE]   sample min/max     : {ptq_data[0][0].min():.0f} / {ptq_data[0][0].max():.0f}  ← must be [0, 255]"
         )
+        if ptq_data[0][0].dtype != np.uint8:
+            raise TypeError(
+                f"[COMPILE] Calibration data must be uint8 to match input_type, got {ptq_data[0][0].dtype}"
+            )
 
         ptq_options.set_tensor_data(ptq_data)
         compile_options.quant_options = ptq_options
@@ -271,10 +354,11 @@ def convert_to_kmodel(
         print(f"[COMPILE] ✓ Compiler created")
 
         import_options = nncase.ImportOptions()
-        with open(onnx_path, "rb") as f:
-            model_content = f.read()
-        print(f"\n[COMPILE] Importing ONNX ({len(model_content)/1024/1024:.2f} MB)...")
-        compiler.import_onnx(model_content, import_options)
+        # Map the file instead of reading it into a bytes object; nncase wraps any
+        # non-bytes argument as a stream, so the parser reads straight from the page cache.
+        with open(onnx_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            print(f"\n[COMPILE] Importing ONNX ({len(mm)/1024/1024:.2f} MB)...")
+            compiler.import_onnx(mm, import_options)
         print(f"[COMPILE] ✓ ONNX imported")
 
         compiler.use_ptq(ptq_options)
@@ -286,21 +370,11 @@ def convert_to_kmodel(
 
         kmodel_bytes = compiler.gencode_tobytes()
         print(f"[COMPILE] ✓ kmodel generated ({len(kmodel_bytes)/1024/1024:.2f} MB)")
-
-        with open(kmodel_path, "wb") as f:
-            f.write(kmodel_bytes)
-
-        size_mb = os.path.getsize(kmodel_path) / (1024 * 1024)
-        print(f"\n{'='*60}")
-        print(f"[OUTPUT] ✓ Saved to  : {kmodel_path}")
-        print(f"[OUTPUT] ✓ File size : {size_mb:.2f} MB")
-
-        if size_mb > 64:
-            print(f"[OUTPUT] ⚠  Model is large — verify it fits in K230D RAM")
-        else:
-            print(f"[OUTPUT] ✓ Size OK for K230D deployment")
-
+        # ptq_options/compile_options reference the calibration buffer until compilation is done
+        del compiler, compile_options, ptq_options, ptq_data
         gc.collect()
+
+        (writer or save_kmodel)(kmodel_path, kmodel_bytes)
         return kmodel_path
 
     except Exception as exc:
@@ -308,28 +382,130 @@ def convert_to_kmodel(
         raise
 
 
+def save_kmodel(kmodel_path: str, kmodel_bytes: bytes) -> str:
+    with open(kmodel_path, "wb") as f:
+        f.write(kmodel_bytes)
+
+    size_mb = os.path.getsize(kmodel_path) / (1024 * 1024)
+    print(f"\n{'='*60}")
+    print(f"[OUTPUT] ✓ Saved to  : {kmodel_path}")
+    print(f"[OUTPUT] ✓ File size : {size_mb:.2f} MB")
+
+    if size_mb > 64:
+        print(f"[OUTPUT] ⚠  Model is large — verify it fits in K230D RAM")
+    else:
+        print(f"[OUTPUT] ✓ Size OK for K230D deployment")
+    return kmodel_path
+
+
+def _read_into_page_cache(path: str, chunk_size: int = 1 << 20) -> None:
+    # Background read so the next model's onnx.load / mmap import hits the page cache
+    with open(path, "rb", buffering=0) as f:
+        while f.read(chunk_size):
+            pass
+
+
+def convert_many(
+    onnx_paths: list,
+    output_dir: str = "./output",
+    calibration_data_path: str = None,
+    img_height: int = 480,
+    img_width: int = 640,
+    num_calibration_samples: int = 300,
+    input_layout: str = "NCHW",
+    **kwargs,
+) -> list:
+    """Convert several ONNX models with the same input size (e.g. ablation sweeps).
+
+    Calibration images are decoded once and shared; each model gets a fresh nncase
+    Compiler (nncase compiles one module per instance). Reading the next ONNX and
+    writing the previous kmodel run on background threads while compile() runs.
+    """
+    print(f"\n[BATCH] Converting {len(onnx_paths)} models")
+    # Output names come from the ONNX file name only; a/best.onnx and b/best.onnx would
+    # overwrite each other's kmodel
+    stems = [Path(p).stem for p in onnx_paths]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        raise ValueError(
+            f"[BATCH] Several inputs share a file name ({', '.join(duplicates)}); their kmodels "
+            f"would overwrite each other in {output_dir}. Rename them or convert them separately."
+        )
+    if calibration_data_path:
+        calibration_data = generate_calibration_data(
+            calibration_data_path,
+            img_height=img_height,
+            img_width=img_width,
+            num_samples=num_calibration_samples,
+            input_layout=input_layout,
+        )
+    else:
+        # Ask once for the whole batch, not once per model
+        confirm_random_calibration()
+        calibration_data = generate_random_calibration(
+            img_height, img_width, n=20, input_layout=input_layout
+        )
+
+    kmodel_paths = []
+    pending_writes = []
+    with ThreadPoolExecutor(max_workers=1) as reader, ThreadPoolExecutor(max_workers=1) as io_writer:
+        prefetch = reader.submit(_read_into_page_cache, onnx_paths[0])
+        for i, onnx_path in enumerate(onnx_paths):
+            prefetch.result()
+            if i + 1 < len(onnx_paths):
+                prefetch = reader.submit(_read_into_page_cache, onnx_paths[i + 1])
+            print(f"\n[BATCH] ({i + 1}/{len(onnx_paths)}) {onnx_path}")
+            kmodel_path = convert_to_kmodel(
+                onnx_path=onnx_path,
+                output_dir=output_dir,
+                calibration_data_path=calibration_data_path,
+                img_height=img_height,
+                img_width=img_width,
+                num_calibration_samples=num_calibration_samples,
+                input_layout=input_layout,
+                calibration_data=calibration_data,
+                writer=lambda path, data: pending_writes.append(io_writer.submit(save_kmodel, path, data)),
+                **kwargs,
+            )
+            kmodel_paths.append(kmodel_path)
+        for write in pending_writes:
+            write.result()  # re-raise write errors
+
+    print(f"\n[BATCH] ✓ {len(kmodel_paths)} kmodels written to {output_dir}")
+    return kmodel_paths
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert YOLOv8 ONNX → K230D kmodel (nncase 2.9.0, standalone)",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    parser.add_argument("onnx", type=str, help="Path to YOLOv8 .onnx model")
+    parser.add_argument("onnx", type=str, nargs="+",
+                        help="Path to YOLOv8 .onnx model (several: batch conversion with shared calibration data)")
     parser.add_argument("--output", type=str, default="./output", help="Output directory for .kmodel")
     parser.add_argument("--calib-data", type=str, required=True, help="Path to calibration images")
     parser.add_argument("--img-height", type=int, default=480, help="Model input height")
     parser.add_argument("--img-width", type=int, default=640, help="Model input width")
-    parser.add_argument("--num-samples", type=int, default=100, help="Number of calibration images")
+    parser.add_argument("--num-samples", type=int, default=300, help="Number of calibration images (300-500 for weight finetuning; uint8 buffer: ~0.9 MB each at 640x480)")
     parser.add_argument("--target", type=str, default="k230", help="nncase target device")
     parser.add_argument("--quant-type", type=str, default="uint8", choices=["uint8", "int8"])
     parser.add_argument("--w-quant-type", type=str, default="uint8", choices=["uint8", "int8"])
     parser.add_argument(
         "--calib-method", type=str, default="Kld", choices=["Kld", "NoClip", "AbsMax"]
     )
+    parser.add_argument(
+        "--input-layout", type=str, default="NCHW", choices=["NCHW", "NHWC"],
+        help="kmodel input layout; NHWC takes interleaved RGB888 frames, "
+             "NCHW the planar rgb888p frames used by libs.YOLO / ai2d",
+    )
+    parser.add_argument(
+        "--no-finetune-weights", action="store_true",
+        help="Skip SQuant weight finetuning (about 2x faster compile, lower int8 accuracy)",
+    )
 
     args = parser.parse_args()
 
-    kmodel_path = convert_to_kmodel(
-        onnx_path=args.onnx,
+    options = dict(
         output_dir=args.output,
         calibration_data_path=args.calib_data,
         img_height=args.img_height,
@@ -339,7 +515,15 @@ def main():
         quant_type=args.quant_type,
         w_quant_type=args.w_quant_type,
         calib_method=args.calib_method,
+        input_layout=args.input_layout,
+        finetune_weights=not args.no_finetune_weights,
     )
+    if len(args.onnx) > 1:
+        kmodel_paths = convert_many(args.onnx, **options)
+        print(f"\n✓ Done! kmodels ready at: {', '.join(kmodel_paths)}\n")
+        return
+
+    kmodel_path = convert_to_kmodel(onnx_path=args.onnx[0], **options)
     print(f"\n✓ Done! kmodel ready at: {kmodel_path}\n")
 
 
@@ -11,6 +11,8 @@ if __name__ == "__main__":
 
     # 2. 画像の読み込みと変換
     # read_image は HWC(Height, Width, Channel) から CHW への変換も行います [1]
+    # ai2d は CHW (planar RGB888) を KPU に渡すため、kmodel は convert_to_kmodel3.py の
+    # --input-layout NCHW (既定) で変換すること。NHWC は interleaved RGB888 を直接渡す場合のみ。
     img_chw, img_rgb888 = read_image(img_path)
 
     # 推論に使用する画像の解像度を取得 [width, height]
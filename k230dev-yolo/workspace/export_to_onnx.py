@@ -7,11 +7,26 @@ Optimizes for 320x320 input and removes NMS for KPU inference
 import os
 import sys
 import gc
+import shutil
 from pathlib import Path
-from ultralytics import YOLO
-import onnx
-import onnxsim
-import torch
+
+
+# Highest opset the convert image can load (onnx==1.9.0 next to nncase 2.9.0)
+MAX_K230D_OPSET = 14
+
+ONNX_OPTIMIZER_PASSES = [
+    "fuse_bn_into_conv",
+    "fuse_consecutive_transposes",
+    "eliminate_identity",
+    "eliminate_nop_pad",
+]
+
+
+def _graph_ops(model):
+    """Serialized nodes and initializers; shape annotations (value_info) are ignored"""
+    graph = model.graph
+    return ([node.SerializeToString() for node in graph.node]
+            + [init.SerializeToString() for init in graph.initializer])
 
 
 def export_to_onnx(
@@ -19,9 +34,10 @@ def export_to_onnx(
     output_dir: str = "/models",
     img_height: int = 480,
     img_width: int = 640,
-    opset: int = 11,
+    opset: int = 13,
     simplify: bool = True,
-    dynamic: bool = False
+    dynamic: bool = False,
+    half: bool = False
 ):
     """
     Export YOLOv8n model to ONNX format for K230D
@@ -31,9 +47,11 @@ def export_to_onnx(
         output_dir: Output directory for ONNX model
         img_height: Input image height (must match training)
         img_width: Input image width (must match training)
-        opset: ONNX opset version (11 or 12 recommended for nncase)
+        opset: ONNX opset version (13 gives onnxsim more rewrites; max 14 for the convert image)
         simplify: Simplify ONNX model
         dynamic: Use dynamic input shapes (False for K230D)
+        half: FP16 weights for host-side ONNX Runtime (GPU export); keep False for nncase,
+            whose PTQ quantizes the FP32 graph to uint8 itself (convert_to_kmodel3.py)
     
     Returns:
         Path to exported ONNX model
@@ -50,13 +68,28 @@ def export_to_onnx(
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
+    if opset > MAX_K230D_OPSET:
+        print(f"⚠ Opset {opset} > {MAX_K230D_OPSET}: the K230D convert container (onnx 1.9) "
+              f"cannot load this model; use --opset 13 for kmodel conversion")
+    
+    # Heavy imports only once the arguments are known to be usable
+    import onnx
+    import onnxsim
+    import torch
+    from ultralytics import YOLO
+    
+    # FP16 export needs a GPU; Ultralytics silently falls back to FP32 on CPU
+    if half and not torch.cuda.is_available():
+        print("⚠ --half needs a CUDA device; exporting FP32")
+        half = False
+    
     # Load model
     print(f"\nLoading model: {model_path}")
     model = YOLO(model_path)
     
     # Generate output filename
     model_name = Path(model_path).stem
-    onnx_filename = f"{model_name}_{img_width}x{img_height}.onnx"
+    onnx_filename = f"{model_name}_{img_width}x{img_height}{'_fp16' if half else ''}.onnx"
     onnx_path = os.path.join(output_dir, onnx_filename)
     
     print(f"\nExport Configuration:")
@@ -64,6 +97,7 @@ def export_to_onnx(
     print(f"  - ONNX Opset: {opset}")
     print(f"  - Dynamic Shapes: {dynamic}")
     print(f"  - Simplify: {simplify}")
+    print(f"  - Precision: {'FP16 (not for kmodel conversion)' if half else 'FP32'}")
     print(f"  - Output: {onnx_path}")
     
     # Export to ONNX
@@ -72,44 +106,77 @@ def export_to_onnx(
     print("=" * 80 + "\n")
     
     # Export with specific settings for K230D
-    model.export(
+    exported_onnx = model.export(
         format="onnx",
         imgsz=(img_height, img_width),
         opset=opset,
         dynamic=dynamic,
         simplify=False,  # We'll do this manually for better control
+        half=half,
+        device=0 if half else None,
     )
     
     # The export creates the file in the same directory as the model
     # Move it to our output directory
-    exported_onnx = str(Path(model_path).parent / f"{model_name}.onnx")
+    exported_onnx = str(exported_onnx or Path(model_path).parent / f"{model_name}.onnx")
     
     if os.path.exists(exported_onnx):
         # Load and check the model
         print("Loading ONNX model for verification...")
         onnx_model = onnx.load(exported_onnx)
+        exported_ops = _graph_ops(onnx_model)
         
         # Simplify the model if requested
         if simplify:
             print("\nSimplifying ONNX model...")
             try:
-                onnx_model, check = onnxsim.simplify(
-                    onnx_model,
-                    dynamic_input_shape=dynamic,
-                    input_shapes={f"images": [1, 3, img_height, img_width]} if not dynamic else None
-                )
-                print(f"  ✓ Simplification successful: {check}")
+                # Static shapes first, so constant folding can collapse the shape ops
+                onnx_model = onnx.shape_inference.infer_shapes(onnx_model)
+                print(f"  - Nodes before: {len(onnx_model.graph.node)}")
+                input_shapes = {"images": [1, 3, img_height, img_width]} if not dynamic else None
+                # Folding often exposes more static shapes; repeat until the graph stops changing
+                for i in range(3):
+                    simplified, check = onnxsim.simplify(
+                        onnx_model,
+                        dynamic_input_shape=dynamic,
+                        overwrite_input_shapes=input_shapes,
+                    )
+                    if not check:
+                        print(f"  ⚠ Pass {i + 1} failed the output check, keeping previous graph")
+                        break
+                    converged = simplified.SerializeToString() == onnx_model.SerializeToString()
+                    onnx_model = simplified
+                    print(f"  ✓ Pass {i + 1}: {len(onnx_model.graph.node)} nodes")
+                    if converged:
+                        break
             except Exception as e:
                 print(f"  ⚠ Simplification failed: {e}")
                 print("  Continuing with original model...")
+            
+            # Optional onnxoptimizer cleanup (Ultralytics/onnxsim already fold BN into Conv;
+            # this catches leftovers such as identities, no-op pads and transpose pairs)
+            try:
+                import onnxoptimizer
+            except ImportError:
+                onnxoptimizer = None
+            if onnxoptimizer is None:
+                print("  ⚠ onnxoptimizer not installed; skipping its passes (pip install onnxoptimizer)")
+            else:
+                try:
+                    onnx_model = onnxoptimizer.optimize(onnx_model, ONNX_OPTIMIZER_PASSES)
+                    print(f"  ✓ onnxoptimizer: {len(onnx_model.graph.node)} nodes")
+                except Exception as e:
+                    print(f"  ⚠ onnxoptimizer failed: {e}")
         
-        # Save the final model
+        # Save the final model; an export no pass changed is moved instead of re-serialized
         print(f"\nSaving ONNX model to: {onnx_path}")
-        onnx.save(onnx_model, onnx_path)
-        
-        # Clean up temporary file
-        if exported_onnx != onnx_path and os.path.exists(exported_onnx):
-            os.remove(exported_onnx)
+        if _graph_ops(onnx_model) != exported_ops:
+            onnx.save(onnx_model, onnx_path)
+            # Clean up temporary file
+            if exported_onnx != onnx_path and os.path.exists(exported_onnx):
+                os.remove(exported_onnx)
+        elif exported_onnx != onnx_path:
+            shutil.move(exported_onnx, onnx_path)
         
         # Print model info
         print("\n" + "=" * 80)
@@ -143,6 +210,64 @@ def export_to_onnx(
         raise RuntimeError(f"ONNX export failed. Expected file not found: {exported_onnx}")
 
 
+def export_to_tensorrt(
+    model_path: str,
+    output_dir: str = "/models",
+    img_height: int = 480,
+    img_width: int = 640,
+    half: bool = True,
+    workspace: int = 4
+):
+    """
+    Build a TensorRT engine for fast validation on an NVIDIA host (not for K230D)
+    
+    Args:
+        model_path: Path to trained .pt model
+        output_dir: Output directory for the .engine file
+        img_height: Input image height (must match training)
+        img_width: Input image width (must match training)
+        half: FP16 engine
+        workspace: TensorRT builder workspace in GB
+    
+    Returns:
+        Path to the .engine file (run it with test_inference.py like a .pt model)
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model not found: {model_path}")
+    
+    import torch
+    from ultralytics import YOLO
+    
+    if not torch.cuda.is_available():
+        raise RuntimeError("TensorRT export needs a CUDA device")
+    
+    print("\n" + "=" * 80)
+    print(f"Exporting TensorRT engine ({'FP16' if half else 'FP32'})")
+    print("=" * 80 + "\n")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    model_name = Path(model_path).stem
+    engine_path = os.path.join(
+        output_dir, f"{model_name}_{img_width}x{img_height}{'_fp16' if half else ''}.engine")
+    
+    exported_engine = YOLO(model_path).export(
+        format="engine",
+        imgsz=(img_height, img_width),
+        half=half,
+        simplify=True,
+        workspace=workspace,
+        device=0,
+    )
+    exported_engine = str(exported_engine or Path(model_path).with_suffix(".engine"))
+    if not os.path.exists(exported_engine):
+        raise RuntimeError(f"TensorRT export failed. Expected file not found: {exported_engine}")
+    if exported_engine != engine_path:
+        shutil.move(exported_engine, engine_path)
+    
+    print(f"\n✓ TensorRT engine saved: {engine_path}")
+    return engine_path
+
+
 if __name__ == "__main__":
     import argparse
     
@@ -151,9 +276,13 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, default="/models", help="Output directory")
     parser.add_argument("--img-height", type=int, default=480, help="Image height")
     parser.add_argument("--img-width", type=int, default=640, help="Image width")
-    parser.add_argument("--opset", type=int, default=11, help="ONNX opset version")
+    parser.add_argument("--opset", type=int, default=13, help="ONNX opset version (max 14 for nncase 2.9 / onnx 1.9)")
     parser.add_argument("--no-simplify", action="store_true", help="Skip ONNX simplification")
     parser.add_argument("--dynamic", action="store_true", help="Use dynamic input shapes")
+    parser.add_argument("--half", action="store_true",
+                        help="FP16 ONNX for ONNX Runtime on GPU (use the FP32 export for the kmodel)")
+    parser.add_argument("--tensorrt", action="store_true",
+                        help="Also build an FP16 TensorRT engine for host-side validation")
     
     args = parser.parse_args()
     
@@ -164,7 +293,17 @@ if __name__ == "__main__":
         img_width=args.img_width,
         opset=args.opset,
         simplify=not args.no_simplify,
-        dynamic=args.dynamic
+        dynamic=args.dynamic,
+        half=args.half
     )
     
     print(f"\n✓ Export complete: {onnx_path}")
+    
+    if args.tensorrt:
+        engine_path = export_to_tensorrt(
+            model_path=args.model,
+            output_dir=args.output,
+            img_height=args.img_height,
+            img_width=args.img_width
+        )
+        print(f"✓ Validate with: python test_inference.py {engine_path}")
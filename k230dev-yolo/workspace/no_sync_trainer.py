@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+DetectionTrainer that skips the DDP gradient AllReduce on accumulation micro-steps
+Passed to model.train(trainer=...), so it also runs in the DDP worker processes
+"""
+
+from torch.nn.parallel import DistributedDataParallel
+from ultralytics.models.yolo.detect import DetectionTrainer
+
+
+class NoSyncDetectionTrainer(DetectionTrainer):
+    """Only the micro-step that ends in optimizer_step() all-reduces gradients.
+
+    BaseTrainer steps the optimizer once ni - last_opt_step >= self.accumulate, i.e. every
+    `accumulate` batches; the same count is kept here. DDP decides in forward() whether the
+    following backward syncs (require_backward_grad_sync, the flag no_sync() toggles), and
+    preprocess_batch runs right before that forward in every training step.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.micro_steps = 0
+
+    def preprocess_batch(self, batch):
+        self.micro_steps += 1
+        if isinstance(self.model, DistributedDataParallel):
+            self.model.require_backward_grad_sync = self.micro_steps >= self.accumulate
+        return super().preprocess_batch(batch)
+
+    def optimizer_step(self):
+        self.micro_steps = 0
+        super().optimizer_step()
@@ -6,28 +6,119 @@ Useful for validating model before K230D deployment
 
 import os
 import sys
+import json
 import cv2
 import numpy as np
 from pathlib import Path
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional; falls back to the NumPy expression below
+    njit = None
 
-def test_pytorch_model(model_path, test_images_dir, output_dir, conf=0.25):
-    """Test PyTorch model inference"""
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def preprocess_kernel(src, dst):
+        """uint8 HWC BGR -> float32 CHW RGB in [0, 1], fused into one pass over src"""
+        height, width = src.shape[0], src.shape[1]
+        scale = np.float32(1.0 / 255.0)
+        for y in prange(height):
+            for c in range(3):
+                for x in range(width):
+                    dst[c, y, x] = src[y, x, 2 - c] * scale
+else:
+    def preprocess_kernel(src, dst):
+        """uint8 HWC BGR -> float32 CHW RGB in [0, 1] (NumPy fallback without numba)"""
+        np.multiply(src[..., ::-1].transpose(2, 0, 1), np.float32(1 / 255.0), out=dst)
+
+
+def find_images(images_dir):
+    """List .jpg/.jpeg/.png files in images_dir (case-insensitive, one scandir pass)"""
+    if not os.path.isdir(images_dir):
+        return []
+    with os.scandir(images_dir) as entries:
+        return sorted(entry.path for entry in entries
+                      if entry.is_file()
+                      and os.path.splitext(entry.name)[1].lower() in ('.jpg', '.jpeg', '.png'))
+
+
+def load_torchscript(model_path, imgsz=320):
+    """Load <model>.torchscript next to the .pt, exporting it first if missing or stale"""
+    import torch
+    
+    ts_path = Path(model_path).with_suffix('.torchscript')
+    if not ts_path.exists() or ts_path.stat().st_mtime < Path(model_path).stat().st_mtime:
+        from ultralytics import YOLO
+        print(f"Exporting TorchScript (one-time): {ts_path}")
+        ts_path = Path(YOLO(model_path).export(format='torchscript', imgsz=imgsz))
+    
+    # Ultralytics stores the traced input size in the file's metadata
+    extra_files = {'config.txt': ''}
+    module = torch.jit.load(str(ts_path), map_location='cpu', _extra_files=extra_files).eval()
+    metadata = json.loads(extra_files['config.txt'] or '{}')
+    input_hw = tuple(metadata.get('imgsz', (imgsz, imgsz)))
+    print(f"Loaded TorchScript: {ts_path} (input {input_hw[1]}x{input_hw[0]})")
+    return module, input_hw
+
+
+def run_torchscript(module, img, input_batch, conf, iou=0.45):
+    """Detect on one BGR image with a TorchScript module; boxes are in original image pixels"""
+    import torch
+    from ultralytics.utils import ops
+    
+    height, width = input_batch.shape[2:]
+    preprocess_kernel(cv2.resize(img, (width, height)), input_batch[0])
+    with torch.inference_mode():
+        pred = module(torch.from_numpy(input_batch))
+    if isinstance(pred, (list, tuple)):
+        pred = pred[0]
+    
+    det = ops.non_max_suppression(pred, conf, iou)[0]
+    det[:, [0, 2]] *= img.shape[1] / width
+    det[:, [1, 3]] *= img.shape[0] / height
+    return [{'cls': int(c), 'conf': float(s), 'xyxy': xyxy} for *xyxy, s, c in det.tolist()]
+
+
+def engine_imgsz(engine_path):
+    """Input (h, w) stored by the Ultralytics exporter in front of a TensorRT engine, or None"""
+    try:
+        with open(engine_path, 'rb') as f:
+            meta_len = int.from_bytes(f.read(4), byteorder='little')
+            metadata = json.loads(f.read(meta_len).decode('utf-8'))
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    imgsz = metadata.get('imgsz') if isinstance(metadata, dict) else None
+    return tuple(imgsz) if imgsz else None
+
+
+def test_pytorch_model(model_path, test_images_dir, output_dir, conf=0.25, save_images=False,
+                       torchscript=False, imgsz=320):
+    """Test PyTorch model inference (detections as JSON; annotated images only if save_images)"""
     from ultralytics import YOLO
     
+    # Static TensorRT engines only accept the size they were built for
+    if Path(model_path).suffix.lower() == '.engine':
+        imgsz = engine_imgsz(model_path) or imgsz
+    
     print("=" * 80)
     print("Testing PyTorch Model")
     print("=" * 80)
     
     # Load model
     print(f"\nLoading model: {model_path}")
-    model = YOLO(model_path)
+    if torchscript:
+        # Skips the ultralytics Python wrapper per call; no annotated images on this path
+        module, input_hw = load_torchscript(model_path, imgsz=imgsz)
+        input_batch = np.empty((1, 3) + input_hw, dtype=np.float32)
+        if save_images:
+            print("⚠ --save-images is ignored with --torchscript")
+    else:
+        model = YOLO(model_path)
     
     # Find test images
-    image_files = []
-    for ext in ['*.jpg', '*.jpeg', '*.png']:
-        image_files.extend(glob(os.path.join(test_images_dir, ext)))
+    image_files = find_images(test_images_dir)
     
     if not image_files:
         print(f"✗ No test images found in {test_images_dir}")
@@ -44,29 +135,49 @@ def test_pytorch_model(model_path, test_images_dir, output_dir, conf=0.25):
         print(f"  Processing: {Path(img_path).name}")
         
         # Run prediction
-        results = model(img_path, conf=conf, imgsz=320)
-        
-        # Save result
-        for r in results:
-            output_path = os.path.join(output_dir, f"result_{Path(img_path).name}")
-            r.save(output_path)
-            
-            # Print detections
+        output_path = os.path.join(output_dir, f"result_{Path(img_path).name}")
+        if torchscript:
+            img = cv2.imread(img_path)
+            if img is None:
+                print(f"    ✗ Could not read image")
+                continue
+            detections = run_torchscript(module, img, input_batch, conf)
+        else:
+            r = model(img_path, conf=conf, imgsz=imgsz)[0]
             boxes = r.boxes
-            if len(boxes) > 0:
-                print(f"    Detections: {len(boxes)}")
-                for box in boxes:
-                    cls = int(box.cls[0])
-                    conf = float(box.conf[0])
-                    print(f"      - Class {cls}: {conf:.2f}")
-            else:
-                print(f"    No detections")
+            detections = [
+                {'cls': int(c), 'conf': float(s), 'xyxy': xyxy}
+                for c, s, xyxy in zip(boxes.cls.tolist(), boxes.conf.tolist(), boxes.xyxy.tolist())
+            ]
+            if save_images:
+                r.save(output_path)
+        
+        # JSON is enough to validate detections; JPEG re-encoding is opt-in
+        with open(output_path + '.json', 'w') as f:
+            json.dump(detections, f)
+        
+        # Print detections
+        if detections:
+            print(f"    Detections: {len(detections)}")
+            for det in detections:
+                print(f"      - Class {det['cls']}: {det['conf']:.2f}")
+        else:
+            print(f"    No detections")
     
     print(f"\n✓ Results saved to: {output_dir}")
     return True
 
 
-def test_onnx_model(onnx_path, test_images_dir, output_dir, img_size=320):
+# --provider choices; CPU is always appended as the fallback
+ORT_PROVIDERS = {
+    'cpu': [],
+    'cuda': ['CUDAExecutionProvider'],
+    'tensorrt': ['TensorrtExecutionProvider', 'CUDAExecutionProvider'],
+}
+
+
+def test_onnx_model(onnx_path, test_images_dir, output_dir, img_size=320, batch_size=8,
+                    provider='cpu'):
     """Test ONNX model inference"""
     import onnxruntime as ort
     
@@ -77,8 +188,21 @@ def test_onnx_model(onnx_path, test_images_dir, output_dir, img_size=320):
     # Load ONNX model
     print(f"\nLoading ONNX model: {onnx_path}")
     try:
-        session = ort.InferenceSession(onnx_path)
+        # Full graph optimization, threads pinned to physical cores (small model,
+        # avoid oversubscription)
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        so.inter_op_num_threads = 1
+        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        
+        # Explicit providers: auto-selection would pay CUDA init even where CPU is faster
+        # for this small model. Quantized models use the MLAS int8 kernels on CPU.
+        providers = ORT_PROVIDERS[provider] + ['CPUExecutionProvider']
+        
+        session = ort.InferenceSession(onnx_path, sess_options=so, providers=providers)
         print(f"✓ Model loaded successfully")
+        print(f"  Providers: {session.get_providers()}")
         
         # Print model info
         input_name = session.get_inputs()[0].name
@@ -93,9 +217,7 @@ def test_onnx_model(onnx_path, test_images_dir, output_dir, img_size=320):
         return False
     
     # Find test images
-    image_files = []
-    for ext in ['*.jpg', '*.jpeg', '*.png']:
-        image_files.extend(glob(os.path.join(test_images_dir, ext)))
+    image_files = find_images(test_images_dir)
     
     if not image_files:
         print(f"✗ No test images found in {test_images_dir}")
@@ -106,32 +228,87 @@ def test_onnx_model(onnx_path, test_images_dir, output_dir, img_size=320):
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
+    # Batch several images per session.run when the model has a dynamic batch
+    # dimension (export_to_onnx.py --dynamic); a static model takes its fixed batch.
+    batch_dim = input_shape[0]
+    static_batch = isinstance(batch_dim, int) and batch_dim > 0
+    if static_batch:
+        batch_size = batch_dim
+    print(f"  Batch size: {batch_size}{' (static)' if static_batch else ''}")
+    print(f"  Preprocessing: {'numba' if njit is not None else 'numpy'}")
+    
+    # Input buffer reused for every batch
+    img_batch = np.empty((batch_size, 3, img_size, img_size), dtype=np.float32)
+    # FP16 exports (export_to_onnx.py --half) take a float16 input; preprocessing stays
+    # float32 and is cast into a second persistent buffer per batch
+    half_batch = None
+    if session.get_inputs()[0].type == 'tensor(float16)':
+        half_batch = np.empty(img_batch.shape, dtype=np.float16)
+        print("  Input type: float16")
+    
+    # Bind the input buffer once: on CPU the OrtValue wraps img_batch's memory, so
+    # refilling it in place needs no per-call copy; on CUDA it is refreshed in place.
+    device = "cuda" if "CUDAExecutionProvider" in session.get_providers() else "cpu"
+    io_binding = session.io_binding()
+    for output in session.get_outputs():
+        io_binding.bind_output(output.name)
+    bound_input = None
+    
     # Test inference
     print("\nRunning inference...")
-    for img_path in image_files[:5]:  # Test first 5 images
-        print(f"  Processing: {Path(img_path).name}")
+    test_files = image_files[:5]  # Test first 5 images
+    
+    def load_resized(img_path):
+        # Runs on the prefetch pool; cv2 releases the GIL while decoding/resizing
+        return cv2.resize(cv2.imread(img_path), (img_size, img_size))
+    
+    # Decode and resize on worker threads so disk I/O overlaps with inference
+    executor = ThreadPoolExecutor(max_workers=4)
+    prefetched = [executor.submit(load_resized, p) for p in test_files]
+    for start in range(0, len(test_files), batch_size):
+        names = []
+        for img_path, future in zip(test_files[start:start + batch_size],
+                                    prefetched[start:start + batch_size]):
+            print(f"  Processing: {Path(img_path).name}")
+            
+            try:
+                # Read and preprocess image
+                img_resized = future.result()
+                # BGR -> RGB, HWC -> CHW and /255 in a single pass into the batch slot
+                preprocess_kernel(img_resized, img_batch[len(names)])
+                names.append(Path(img_path).name)
+            except Exception as e:
+                print(f"    ✗ Preprocessing failed: {e}")
+        
+        if not names:
+            continue
         
         try:
-            # Read and preprocess image
-            img = cv2.imread(img_path)
-            img_resized = cv2.resize(img, (img_size, img_size))
-            img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-            img_normalized = img_rgb.astype(np.float32) / 255.0
-            img_transposed = np.transpose(img_normalized, (2, 0, 1))
-            img_batch = np.expand_dims(img_transposed, axis=0)
-            
-            # Run inference
-            outputs = session.run(None, {input_name: img_batch})
-            
+            # Run inference once for the whole batch
+            if half_batch is not None:
+                np.copyto(half_batch[:len(names)], img_batch[:len(names)], casting='same_kind')
+            batch = img_batch if half_batch is None else half_batch
+            feed = batch if static_batch else batch[:len(names)]
+            if bound_input is None or bound_input.shape() != list(feed.shape):
+                bound_input = ort.OrtValue.ortvalue_from_numpy(feed, device, 0)
+                io_binding.bind_ortvalue_input(input_name, bound_input)
+            elif device != "cpu":
+                bound_input.update_inplace(feed)
+            session.run_with_iobinding(io_binding)
+            outputs = io_binding.copy_outputs_to_cpu()
+        except Exception as e:
+            print(f"    ✗ Inference failed: {e}")
+            continue
+        
+        for j, name in enumerate(names):
             # Print output shapes
-            print(f"    Output shapes: {[o.shape for o in outputs]}")
+            print(f"  {name}")
+            print(f"    Output shapes: {[o[j:j + 1].shape for o in outputs]}")
             
             # Check for detections (simplified)
-            if outputs[0].size > 0:
+            if outputs[0][j].size > 0:
                 print(f"    ✓ Inference successful")
-            
-        except Exception as e:
-            print(f"    ✗ Inference failed: {e}")
+    executor.shutdown()
     
     print(f"\n✓ ONNX model testing complete")
     return True
@@ -141,7 +318,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Test model inference")
-    parser.add_argument("model", type=str, help="Path to model (.pt or .onnx)")
+    parser.add_argument("model", type=str, help="Path to model (.pt, .engine or .onnx)")
     parser.add_argument("--test-images", type=str, default="/test_images",
                         help="Directory with test images")
     parser.add_argument("--output", type=str, default="/output/test_results",
@@ -149,30 +326,43 @@ def main():
     parser.add_argument("--conf", type=float, default=0.25,
                         help="Confidence threshold")
     parser.add_argument("--img", type=int, default=320,
-                        help="Image size")
+                        help="Image size (.engine files use the size stored in the engine)")
+    parser.add_argument("--batch", type=int, default=8,
+                        help="ONNX batch size (dynamic-batch models only)")
+    parser.add_argument("--provider", type=str, default="cpu", choices=sorted(ORT_PROVIDERS),
+                        help="ONNX Runtime execution provider (CPU is always the fallback)")
+    parser.add_argument("--save-images", action="store_true",
+                        help="Also save annotated images (PyTorch only; JSON is always written)")
+    parser.add_argument("--torchscript", action="store_true",
+                        help="Run .pt models via TorchScript (exported once next to the .pt)")
     
     args = parser.parse_args()
     
     # Check model type
     model_ext = Path(args.model).suffix.lower()
     
-    if model_ext == '.pt':
+    if model_ext in ('.pt', '.engine'):  # TensorRT engines run through YOLO() as well
         success = test_pytorch_model(
             args.model,
             args.test_images,
             args.output,
-            args.conf
+            args.conf,
+            args.save_images,
+            args.torchscript and model_ext == ".pt",
+            args.img
         )
     elif model_ext == '.onnx':
         success = test_onnx_model(
             args.model,
             args.test_images,
             args.output,
-            args.img
+            args.img,
+            args.batch,
+            args.provider
         )
     else:
         print(f"✗ Unsupported model format: {model_ext}")
-        print("  Supported: .pt, .onnx")
+        print("  Supported: .pt, .engine, .onnx")
         sys.exit(1)
     
     if success:
@@ -26,6 +26,7 @@ DEFAULT_IMG_HEIGHT = 480
 DEFAULT_IMG_WIDTH = 640
 CONF_THRESH = 0.25
 IOU_THRESH = 0.45
+MAX_NMS_CANDIDATES = 300  # top-K boxes by score passed to NMS
 
 # Box colors BGR (one per class, cycle if more classes)
 BOX_COLORS = [
@@ -71,57 +72,80 @@ def _postprocess_yolo(output, conf_thresh, iou_thresh, img_height, img_width):
     raw = np.squeeze(output[0])  # (6, 6300)
     pred = raw.T                  # (6300, 6)  -> (xc, yc, w, h, score0, score1)
 
-    detections = []
-    for i in range(pred.shape[0]):
-        xc, yc, w, h = pred[i, :4]
-        scores = pred[i, 4:]
-
-        conf = float(np.max(scores))
-        if conf < conf_thresh:
-            continue
-        cls_id = int(np.argmax(scores))
-
-        # Coordinates are already in pixel space (not normalized)
-        x1 = int(xc - w / 2)
-        y1 = int(yc - h / 2)
-        x2 = int(xc + w / 2)
-        y2 = int(yc + h / 2)
-        x1 = max(0, min(x1, img_width - 1))
-        y1 = max(0, min(y1, img_height - 1))
-        x2 = max(0, min(x2, img_width))
-        y2 = max(0, min(y2, img_height))
-        detections.append((x1, y1, x2, y2, conf, cls_id))
-
-    return _nms(detections, iou_thresh)
+    scores = pred[:, 4:]
+    confs = scores.max(axis=1)
+    keep = np.flatnonzero(confs >= conf_thresh)
+    if keep.size == 0:
+        return []
+    # Bound the NMS input: only the highest-scoring candidates can survive anyway
+    if keep.size > MAX_NMS_CANDIDATES:
+        top = np.argpartition(confs[keep], -MAX_NMS_CANDIDATES)[-MAX_NMS_CANDIDATES:]
+        keep = np.sort(keep[top])
+    xc, yc, w, h = pred[keep, :4].T
+    confs = confs[keep]
+    cls_ids = scores[keep].argmax(axis=1)
+
+    # Coordinates are already in pixel space (not normalized)
+    half_w = w * 0.5
+    half_h = h * 0.5
+    x1 = (xc - half_w).astype(np.int64)
+    y1 = (yc - half_h).astype(np.int64)
+    x2 = (xc + half_w).astype(np.int64)
+    y2 = (yc + half_h).astype(np.int64)
+    # Clip to the image in place: one pass per coordinate, no temporaries
+    np.clip(x1, 0, img_width - 1, out=x1)
+    np.clip(y1, 0, img_height - 1, out=y1)
+    np.clip(x2, 0, img_width, out=x2)
+    np.clip(y2, 0, img_height, out=y2)
+
+    keep = _nms_indices(x1, y1, x2, y2, confs, cls_ids, iou_thresh)
+    return [
+        (int(x1[i]), int(y1[i]), int(x2[i]), int(y2[i]), float(confs[i]), int(cls_ids[i]))
+        for i in keep
+    ]
+
+def _nms_indices(x1, y1, x2, y2, scores, cls_ids, iou_threshold):
+    """Non-maximum suppression over parallel box arrays. Returns kept indices, best first."""
+    x1, y1, x2, y2 = (np.asarray(v, dtype=np.float64) for v in (x1, y1, x2, y2))
+    cls_ids = np.asarray(cls_ids)
+    areas = (x2 - x1) * (y2 - y1)
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+        # IoU of the best box against every remaining box in one shot
+        w = np.maximum(0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]))
+        h = np.maximum(0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]))
+        inter = w * h
+        union = areas[i] + areas[rest] - inter
+        iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        order = rest[(cls_ids[rest] != cls_ids[i]) | (iou < iou_threshold)]
+    return keep
 
 def _nms(detections, iou_threshold):
     """Non-maximum suppression. detections: list of (x1, y1, x2, y2, conf, cls_id)."""
     if not detections:
         return []
-    detections = sorted(detections, key=lambda x: x[4], reverse=True)
-    keep = []
-    while detections:
-        best = detections.pop(0)
-        keep.append(best)
-        x1_b, y1_b, x2_b, y2_b, _, c_b = best
-        area_b = (x2_b - x1_b) * (y2_b - y1_b)
-        def iou(other):
-            x1, y1, x2, y2 = other[0], other[1], other[2], other[3]
-            xi1, yi1 = max(x1_b, x1), max(y1_b, y1)
-            xi2, yi2 = min(x2_b, x2), min(y2_b, y2)
-            inter = max(0, xi2 - xi1) * max(0, yi2 - yi1)
-            area = (x2 - x1) * (y2 - y1)
-            return inter / (area_b + area - inter) if (area_b + area - inter) > 0 else 0
-        detections = [d for d in detections if d[5] != c_b or iou(d) < iou_threshold]
-    return keep
+    x1, y1, x2, y2, scores, cls_ids = zip(*detections)
+    keep = _nms_indices(x1, y1, x2, y2, scores, cls_ids, iou_threshold)
+    return [detections[i] for i in keep]
 
 
 def _draw_detections(img, detections, class_names):
     """Draw boxes and labels on img (BGR)."""
+    # Per-class colour and label prefix, built once instead of per box
+    num_classes = len(class_names)
+    colors = [BOX_COLORS[i % len(BOX_COLORS)] for i in range(num_classes)]
+    prefixes = [f"{name} " for name in class_names]
     for (x1, y1, x2, y2, conf, cls_id) in detections:
-        color = BOX_COLORS[cls_id % len(BOX_COLORS)]
-        name = class_names[cls_id] if cls_id < len(class_names) else f"class_{cls_id}"
-        label = f"{name} {conf:.2f}"
+        if cls_id < num_classes:
+            color = colors[cls_id]
+            label = prefixes[cls_id] + f"{conf:.2f}"
+        else:
+            color = BOX_COLORS[cls_id % len(BOX_COLORS)]
+            label = f"class_{cls_id} {conf:.2f}"
         cv2.rectangle(img, (x1, y1), (x2, y2), color, 2)
         (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
         cv2.rectangle(img, (x1, y1 - th - 6), (x1 + tw, y1), color, -1)
@@ -171,11 +195,9 @@ def test_onnx_image(
     cv2.imwrite(resized_path, resized_img)
     print("Resized image saved as", resized_path)
 
-    # BGR -> RGB, HWC -> CHW, normalize [0, 1]
-    image_data = cv2.cvtColor(resized_img, cv2.COLOR_BGR2RGB)
-    image_data = image_data.transpose(2, 0, 1)
-    image_data = np.expand_dims(image_data, axis=0).astype(np.float32)
-    image_data /= 255.0
+    # BGR -> RGB (reversed-stride view), HWC -> CHW, normalize [0, 1] in one pass
+    image_data = np.empty((1, 3, img_height, img_width), dtype=np.float32)
+    np.multiply(resized_img[..., ::-1].transpose(2, 0, 1), np.float32(1 / 255.0), out=image_data[0])
 
     # 3. Inference
     outputs = session.run(None, {input_name: image_data})
@@ -6,10 +6,322 @@ Trains at 320x320 resolution for optimal memory usage on 128MB RAM
 
 import os
 import gc
-import yaml
+import shutil
 from pathlib import Path
-from ultralytics import YOLO
-import torch
+
+# Ultralytics reads PIN_MEMORY at import time; its InfiniteDataLoader already keeps workers
+# alive across epochs, so pinned batches + persistent workers need no trainer patching.
+# torch/ultralytics themselves are imported inside the functions (seconds on a cold start),
+# so --help and argument errors return immediately.
+os.environ.setdefault("PIN_MEMORY", "True")
+# Headless matplotlib backend for whatever plots are still rendered
+os.environ.setdefault("MPLBACKEND", "Agg")
+from validate_dataset import count_images, load_yaml
+
+
+def auto_workers(batch_size):
+    """Dataloader workers: at least min(batch, 4), but never more than the CPU count"""
+    if batch_size < 1:
+        batch_size = 16  # AutoBatch: size not known yet
+    return min(os.cpu_count() or 1, max(batch_size, 4))
+
+
+def count_train_images(data_config, yaml_dir):
+    """Train image count and the directory it lives in; a relative dataset path is taken
+    relative to data.yaml, and train may be an image directory or a .txt list of images"""
+    train = data_config.get('train')
+    if not isinstance(train, str):
+        return 0, None
+    root = os.path.join(yaml_dir, data_config.get('path') or '')
+    train_path = os.path.join(root, train)
+    if os.path.isfile(train_path) and train_path.endswith('.txt'):
+        with open(train_path) as f:
+            return sum(1 for line in f if line.strip()), os.path.dirname(train_path)
+    num_images, _ = count_images(train_path)
+    return num_images, train_path
+
+
+def auto_cache(data_config, img_height, img_width, world_size=1, yaml_dir=''):
+    """'ram' if the decoded train set fits in half the available RAM, else 'disk' if it
+    fits in half the free disk space (.npy files next to the images), else False.
+    Under DDP every rank holds its own RAM cache, so that estimate is multiplied by world_size."""
+    num_images, train_dir = count_train_images(data_config, yaml_dir)
+    if not num_images:
+        # An unresolved path would otherwise estimate 0 bytes and always pick 'ram'
+        print(f"⚠ No train images found at {train_dir or data_config.get('train')}; not caching images (pass --cache to override)")
+        return False
+    estimated_bytes = num_images * img_height * img_width * 3
+    print(f"  - Cache estimate: {num_images} images ≈ {estimated_bytes / 1e9:.2f} GB")
+    
+    try:
+        import psutil  # installed with ultralytics
+        available = psutil.virtual_memory().available
+        print(f"    available RAM: {available / 1e9:.2f} GB")
+        if world_size > 1:
+            print(f"    RAM cache for {world_size} DDP ranks: {estimated_bytes * world_size / 1e9:.2f} GB")
+        if estimated_bytes * world_size < available * 0.5:
+            return 'ram'
+    except ImportError:
+        pass
+    
+    # Disk cache stores frames at source resolution, so this estimate is a lower bound
+    try:
+        free = shutil.disk_usage(train_dir).free
+    except (OSError, TypeError):
+        print(f"⚠ Cannot read free disk space for {train_dir}; not caching images")
+        return False
+    print(f"    free disk: {free / 1e9:.2f} GB")
+    return 'disk' if estimated_bytes < free * 0.5 else False
+
+
+def auto_device():
+    """First GPU ('0') if CUDA is available, else 'cpu'.
+    
+    Multi-GPU DDP is opt-in (--device 0,1,...): Ultralytics runs it in generated
+    subprocesses that never receive the callbacks from add_training_callbacks().
+    """
+    import torch
+    
+    return "0" if torch.cuda.is_available() else "cpu"
+
+
+# Features registered as trainer callbacks, i.e. lost in DDP subprocesses
+CALLBACK_FEATURES = [
+    "torch.compile", "fused AdamW", "channels_last", "non-blocking target copies",
+    "async checkpoints", "JSON epoch log", "batch LR scaling", "cuDNN warmup",
+]
+
+
+def add_compile_callbacks(model, mode="reduce-overhead"):
+    """Run the layer stack through torch.compile during training epochs.
+    
+    The trainer builds its own model, so compilation happens in trainer callbacks. Only the
+    per-layer forward (_predict_once) is compiled, as an instance attribute: state_dict keys
+    stay unchanged for EMA, and the attribute is removed before checkpoints are pickled.
+    Single-process only; DDP subprocesses do not receive callbacks and stay eager.
+    """
+    import torch
+    import torch._dynamo
+    from ultralytics.utils.torch_utils import de_parallel
+    
+    # Ops that fail to compile fall back to eager instead of aborting training
+    torch._dynamo.config.suppress_errors = True
+    
+    def on_train_epoch_start(trainer):
+        net = de_parallel(trainer.model)
+        net._predict_once = torch.compile(net._predict_once, mode=mode, fullgraph=False, dynamic=False)
+    
+    def on_train_epoch_end(trainer):
+        de_parallel(trainer.model).__dict__.pop("_predict_once", None)
+    
+    model.add_callback("on_train_epoch_start", on_train_epoch_start)
+    model.add_callback("on_train_epoch_end", on_train_epoch_end)
+
+
+def add_fused_adamw_callback(model):
+    """Switch the trainer's Adam/AdamW to the fused CUDA kernel (one kernel for all params).
+    
+    The flags are flipped on the existing param groups instead of rebuilding the optimizer,
+    so the LR scheduler keeps its reference. SGD (optimizer='auto' on long runs) is left as is.
+    """
+    import torch
+    
+    def on_pretrain_routine_end(trainer):
+        optimizer = trainer.optimizer
+        if not isinstance(optimizer, (torch.optim.Adam, torch.optim.AdamW)):
+            return
+        if not all(p.is_cuda for g in optimizer.param_groups for p in g["params"]):
+            return
+        for group in optimizer.param_groups:
+            group["foreach"] = False  # fused and foreach are mutually exclusive
+            group["fused"] = True
+        print(f"  - Optimizer: fused {type(optimizer).__name__}")
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_channels_last_callback(model):
+    """Train in channels_last (NHWC) so cuDNN can use its tensor-core conv kernels.
+    
+    Applied to the trainer's own model (the YOLO wrapper's copy is rebuilt by the trainer);
+    Module.to() keeps the Parameter objects, so the optimizer and EMA stay valid.
+    """
+    import torch
+    
+    def on_pretrain_routine_end(trainer):
+        trainer.model.to(memory_format=torch.channels_last)
+        preprocess_batch = trainer.preprocess_batch
+        
+        def preprocess_batch_channels_last(batch):
+            batch = preprocess_batch(batch)
+            batch["img"] = batch["img"].contiguous(memory_format=torch.channels_last)
+            return batch
+        
+        trainer.preprocess_batch = preprocess_batch_channels_last
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_non_blocking_targets_callback(model):
+    """Copy the batch targets to the GPU asynchronously, like the images.
+    
+    DetectionTrainer already moves batch["img"] with non_blocking=True, but cls/bboxes/batch_idx
+    stay on the CPU until the loss calls a synchronous .to(device). The DataLoader pins them
+    (PIN_MEMORY), so they can be queued right behind the image copy instead.
+    """
+    def on_pretrain_routine_end(trainer):
+        preprocess_batch = trainer.preprocess_batch
+        
+        def preprocess_batch_non_blocking(batch):
+            for k in ("cls", "bboxes", "batch_idx"):
+                if k in batch:  # the cuDNN warmup batch carries only "img"
+                    batch[k] = batch[k].to(trainer.device, non_blocking=True)
+            return preprocess_batch(batch)
+        
+        trainer.preprocess_batch = preprocess_batch_non_blocking
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_async_checkpoint_callback(model):
+    """Write checkpoints to disk on a background thread.
+    
+    The checkpoint is still serialized into memory on the training thread (a consistent
+    snapshot of model/EMA/optimizer); only the file write runs in the background.
+    Pending writes are flushed before the final evaluation reads best.pt/last.pt.
+    """
+    import io
+    import torch
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def on_pretrain_routine_end(trainer):
+        writer = ThreadPoolExecutor(max_workers=1)
+        pending = []
+        torch_save = torch.save
+        save_model, final_eval = trainer.save_model, trainer.final_eval
+        
+        def write_file(path, data):
+            with open(path, "wb") as f:
+                f.write(data)
+        
+        def save_to_memory(obj, f, *args, **kwargs):
+            if not isinstance(f, (str, os.PathLike)):
+                return torch_save(obj, f, *args, **kwargs)
+            buffer = io.BytesIO()
+            torch_save(obj, buffer, *args, **kwargs)
+            pending.append(writer.submit(write_file, f, buffer.getvalue()))
+        
+        def save_model_async():
+            torch.save = save_to_memory
+            try:
+                save_model()
+            finally:
+                torch.save = torch_save
+        
+        def final_eval_after_writes():
+            for write in pending:
+                write.result()  # re-raise write errors
+            writer.shutdown()
+            final_eval()
+        
+        trainer.save_model = save_model_async
+        trainer.final_eval = final_eval_after_writes
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_epoch_log_callback(model):
+    """Print one JSON line per epoch (losses + validation metrics) to stderr"""
+    import json
+    import sys
+    
+    def on_fit_epoch_end(trainer):
+        record = {"epoch": trainer.epoch + 1}
+        record.update(trainer.label_loss_items(trainer.tloss, prefix="train"))
+        record.update(trainer.metrics)
+        print(json.dumps({k: round(float(v), 5) for k, v in record.items()}), file=sys.stderr)
+    
+    model.add_callback("on_fit_epoch_end", on_fit_epoch_end)
+
+
+def add_batch_lr_callback(model, nbs):
+    """Log the batch size the trainer ended up with (AutoBatch) and scale LR with it.
+    
+    Below nbs Ultralytics accumulates gradients up to nbs images per step, so only a larger
+    batch changes the effective batch; LR then follows the square-root rule sqrt(batch / nbs).
+    Single-process runs only (DDP subprocesses do not receive callbacks).
+    """
+    import math
+    
+    def on_pretrain_routine_end(trainer):
+        batch = trainer.batch_size
+        print(f"  - Batch Size (picked): {batch}")
+        if batch <= nbs:
+            return
+        scale = math.sqrt(batch / nbs)
+        for group in trainer.optimizer.param_groups:
+            group["initial_lr"] *= scale  # warmup and the scheduler both start from initial_lr
+            group["lr"] *= scale
+        trainer.scheduler.base_lrs = [lr * scale for lr in trainer.scheduler.base_lrs]
+        print(f"  - LR scaled x{scale:.2f} for batch {batch} (sqrt rule, nbs={nbs})")
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_cudnn_warmup_callback(model, steps=5):
+    """Run dummy batches through the trainer's model before epoch 1 starts.
+    
+    With cudnn.benchmark the first steps of each input shape autotune conv algorithms;
+    doing that up front keeps the epoch-1 timing (and patience) at steady-state speed.
+    Runs in eval mode so BatchNorm running stats are untouched; gradients are discarded.
+    """
+    import torch
+    
+    def on_pretrain_routine_end(trainer):
+        net = trainer.model
+        size = max(trainer.args.imgsz) if isinstance(trainer.args.imgsz, (list, tuple)) else trainer.args.imgsz
+        # Same preprocessing (device, float, /255, channels_last) as real batches
+        batch = trainer.preprocess_batch(
+            {"img": torch.zeros(trainer.batch_size, 3, size, size, dtype=torch.uint8)})
+        net.eval()
+        with torch.autocast("cuda", enabled=trainer.amp):
+            with torch.no_grad():
+                for _ in range(steps):
+                    net(batch["img"])
+            out = net(batch["img"])
+            loss = sum(o.float().sum() for o in (out if isinstance(out, (list, tuple)) else [out])
+                       if isinstance(o, torch.Tensor))
+        loss.backward()
+        net.zero_grad(set_to_none=True)
+        net.train()
+        torch.cuda.synchronize()
+        print(f"  - cuDNN warmup: {steps} forward + 1 backward at {trainer.batch_size}x3x{size}x{size}")
+    
+    model.add_callback("on_pretrain_routine_end", on_pretrain_routine_end)
+
+
+def add_training_callbacks(model, nbs, compile_model=False, deterministic=False):
+    """Register the trainer callbacks above in the order they have to run.
+    
+    The on_pretrain_routine_end callbacks wrap trainer.preprocess_batch one after another;
+    the cuDNN warmup comes last so its dummy batch goes through the fully wrapped version.
+    """
+    import torch
+    
+    cuda = torch.cuda.is_available()
+    add_async_checkpoint_callback(model)
+    add_epoch_log_callback(model)
+    if cuda:
+        add_non_blocking_targets_callback(model)
+    if cuda and torch.cuda.get_device_capability()[0] >= 7:
+        add_fused_adamw_callback(model)
+        add_channels_last_callback(model)
+    if compile_model:
+        add_compile_callbacks(model)
+    add_batch_lr_callback(model, nbs)
+    if cuda and not deterministic:
+        add_cudnn_warmup_callback(model)
+
 
 def train_yolov8n(
     data_yaml: str = "data.yaml",
@@ -19,10 +331,17 @@ def train_yolov8n(
     img_width: int = 640,   # Default raw input width
     project: str = "/runs",
     name: str = "yolov8n_k230d",
-    device: str = "0",
-    workers: int = 8,
-    cache: bool = False,
-    pretrained: bool = True
+    device: str = None,
+    workers: int = None,
+    cache=None,
+    pretrained: bool = True,
+    amp: bool = True,
+    compile_model: bool = False,
+    accumulate: int = None,
+    deterministic: bool = False,
+    close_mosaic: int = 10,
+    save_period: int = -1,
+    plots: bool = False
 ):
     """
     Train YOLOv8n model optimized for K230D deployment
@@ -30,15 +349,22 @@ def train_yolov8n(
     Args:
         data_yaml: Path to dataset configuration
         epochs: Number of training epochs
-        batch_size: Training batch size
+        batch_size: Training batch size (-1: AutoBatch, largest that fits in GPU memory)
         img_height: Input image height (e.g., 480 for 640x480)
         img_width: Input image width (e.g., 640 for 640x480)
         project: Project directory for saving runs
         name: Run name
-        device: CUDA device (e.g., '0' or 'cpu')
-        workers: Number of data loading workers
-        cache: Cache images in RAM
+        device: CUDA device(s) (e.g., '0', '0,1,2,3' for DDP or 'cpu'; None: GPU 0, else CPU)
+        workers: Number of data loading workers (None: auto from CPU count and batch)
+        cache: 'ram', 'disk' or False; None picks RAM, then disk, when the train set fits
         pretrained: Use pretrained weights
+        amp: Automatic Mixed Precision (autocast + GradScaler)
+        compile_model: torch.compile the forward pass (CUDA, single GPU)
+        accumulate: Micro-batches per optimizer step (None: Ultralytics default, nbs=64)
+        deterministic: Reproducible kernels instead of cuDNN autotuning
+        close_mosaic: Train the final N epochs without mosaic (cheaper loading, better fit)
+        save_period: Extra epoch<N>.pt snapshot every N epochs (-1: only best.pt/last.pt)
+        plots: Render label/batch previews, PR curves and confusion matrices
     """
     
     print("=" * 80)
@@ -49,9 +375,22 @@ def train_yolov8n(
     if not os.path.exists(data_yaml):
         raise FileNotFoundError(f"Dataset config not found: {data_yaml}")
     
+    import torch
+    from ultralytics import YOLO
+    
+    # Share worker tensors through files, not one fd each (avoids "too many open files")
+    torch.multiprocessing.set_sharing_strategy('file_system')
+    
+    # TF32 tensor cores for FP32 ops that run outside autocast (Ampere+, no-op on older GPUs)
+    if torch.cuda.is_available():
+        torch.set_float32_matmul_precision('high')
+        torch.backends.cudnn.allow_tf32 = True
+        # Input shape is fixed, so cuDNN can benchmark conv algorithms once and reuse them
+        torch.backends.cudnn.benchmark = not deterministic
+        os.environ.setdefault('CUBLAS_WORKSPACE_CONFIG', ':4096:8')
+    
     # Load and verify dataset config
-    with open(data_yaml, 'r') as f:
-        data_config = yaml.safe_load(f)
+    data_config = load_yaml(data_yaml)
     
     print(f"\nDataset Configuration:")
     print(f"  - Train: {data_config.get('train', 'N/A')}")
@@ -59,25 +398,72 @@ def train_yolov8n(
     print(f"  - Classes: {data_config.get('nc', 'N/A')}")
     print(f"  - Names: {data_config.get('names', 'N/A')}")
     
+    # Several devices -> Ultralytics spawns one DDP process per GPU via torch.distributed.run
+    # (never DataParallel); workers and batch size are then per GPU.
+    if device is None:
+        device = auto_device()
+    elif isinstance(device, (list, tuple)):
+        device = ",".join(str(d) for d in device)
+    world_size = len(str(device).split(","))  # one process per listed GPU
+    if world_size > 1:
+        print(f"⚠ DDP on {world_size} GPUs: worker processes do not run this script's callbacks; "
+              f"disabled: {', '.join(CALLBACK_FEATURES)}")
+    
+    # Auto-tune dataloader workers and RAM caching
+    if workers is None:
+        workers = auto_workers(batch_size)
+    if cache is None:
+        cache = auto_cache(data_config, img_height, img_width, world_size,
+                           yaml_dir=os.path.dirname(os.path.abspath(data_yaml)))
+    
     # Initialize model
     model_name = "yolov8n.pt" if pretrained else "yolov8n.yaml"
     print(f"\nInitializing model: {model_name}")
     model = YOLO(model_name)
     
+    if compile_model and not (torch.cuda.is_available() and hasattr(torch, "compile")):
+        print("⚠ torch.compile needs CUDA and PyTorch >= 2.0; training eagerly")
+        compile_model = False
+    
     # Training configuration
     print(f"\nTraining Configuration:")
     print(f"  - Image Size: {img_width}x{img_height}")
-    print(f"  - Batch Size: {batch_size}")
+    print(f"  - Batch Size: {batch_size if batch_size > 0 else 'auto (AutoBatch)'}")
     print(f"  - Epochs: {epochs}")
     print(f"  - Device: {device}")
     print(f"  - Workers: {workers}")
+    print(f"  - Cache: {cache}")
+    print(f"  - AMP: {amp}")
+    print(f"  - torch.compile: {compile_model}")
+    
+    # Ultralytics accumulates gradients until the nominal batch size (nbs) is reached and
+    # scales weight decay to match, so accumulation is expressed through nbs. Under DDP,
+    # NoSyncDetectionTrainer all-reduces only on the micro-step that steps the optimizer.
+    if accumulate and batch_size < 1:
+        print("⚠ --accumulate needs a fixed --batch; using the default nominal batch of 64")
+        accumulate = None
+    nbs = batch_size * accumulate if accumulate else 64
+    if batch_size > 0:
+        print(f"  - Effective Batch: {max(nbs, batch_size)} "
+              f"(accumulate {max(round(nbs / batch_size), 1)} steps)")
+    elif world_size > 1:
+        print("⚠ AutoBatch is single-GPU only; Ultralytics falls back to batch=16 for DDP")
+    add_training_callbacks(model, nbs, compile_model=compile_model, deterministic=deterministic)
     
     # Train the model
     print("\n" + "=" * 80)
     print("Starting Training...")
     print("=" * 80 + "\n")
     
+    if world_size > 1:
+        # The generated DDP script imports the trainer class by module name
+        workspace_dir = os.path.dirname(os.path.abspath(__file__))
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            p for p in (workspace_dir, os.environ.get("PYTHONPATH")) if p)
+    from no_sync_trainer import NoSyncDetectionTrainer
+    
     results = model.train(
+        trainer=NoSyncDetectionTrainer,
         data=data_yaml,
         epochs=epochs,
         imgsz=(img_height, img_width),
@@ -87,11 +473,14 @@ def train_yolov8n(
         project=project,
         name=name,
         cache=cache,
+        nbs=nbs,
+        deterministic=deterministic,  # Ultralytics defaults to True, which disables autotuning
         # Optimization settings for faster training
-        amp=True,  # Automatic Mixed Precision
+        amp=amp,  # Automatic Mixed Precision
         patience=50,
         save=True,
-        save_period=10,
+        save_period=save_period,
+        plots=plots,
         # Augmentation (moderate for better convergence)
         hsv_h=0.015,
         hsv_s=0.7,
@@ -104,6 +493,7 @@ def train_yolov8n(
         flipud=0.0,
         fliplr=0.5,
         mosaic=1.0,
+        close_mosaic=close_mosaic,
         mixup=0.0,
         copy_paste=0.0,
     )
@@ -126,7 +516,9 @@ def train_yolov8n(
     print("=" * 80 + "\n")
     
     best_model = YOLO(str(best_model_path))
-    metrics = best_model.val(data=data_yaml, imgsz=(img_height, img_width), device=device)
+    # Validation runs in this process on the first device
+    metrics = best_model.val(data=data_yaml, imgsz=(img_height, img_width), device=str(device).split(",")[0],
+                             plots=plots)
     
     print(f"\nValidation Results:")
     print(f"  - mAP50: {metrics.box.map50:.4f}")
@@ -148,15 +540,33 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Train YOLOv8n for K230D")
     parser.add_argument("--data", type=str, default="data.yaml", help="Path to data.yaml")
     parser.add_argument("--epochs", type=int, default=100, help="Number of epochs")
-    parser.add_argument("--batch", type=int, default=16, help="Batch size")
+    parser.add_argument("--batch", type=int, default=-1,
+                        help="Batch size (default: -1, AutoBatch picks the largest that fits)")
     parser.add_argument("--img-height", type=int, default=480, help="Image height (default: 480)")
     parser.add_argument("--img-width", type=int, default=640, help="Image width (default: 640)")
     parser.add_argument("--project", type=str, default="/runs", help="Project directory")
     parser.add_argument("--name", type=str, default="yolov8n_k230d", help="Run name")
-    parser.add_argument("--device", type=str, default="0", help="CUDA device")
-    parser.add_argument("--workers", type=int, default=8, help="Number of workers")
-    parser.add_argument("--cache", action="store_true", help="Cache images")
+    parser.add_argument("--device", type=str, default=None,
+                        help="CUDA device(s), e.g. 0 or 0,1,2,3 for DDP (default: GPU 0, else CPU; "
+                             "DDP skips compile/channels_last/AutoBatch and the other callbacks)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of workers (default: min(CPU count, max(batch, 4)))")
+    parser.add_argument("--cache", type=str, default="auto", choices=["ram", "disk", "none", "auto"],
+                        help="Image cache (auto: RAM if it fits in half the free RAM, else disk)")
     parser.add_argument("--no-pretrained", action="store_true", help="Train from scratch")
+    parser.add_argument("--no-amp", action="store_true", help="Disable mixed precision (train in FP32)")
+    parser.add_argument("--accumulate", type=int, default=None,
+                        help="Micro-batches per optimizer step (default: accumulate to 64 images)")
+    parser.add_argument("--plots", action="store_true",
+                        help="Render training/validation plots (off by default: slow, headless runs)")
+    parser.add_argument("--save-period", type=int, default=-1,
+                        help="Save epoch<N>.pt every N epochs (default: -1, best/last only)")
+    parser.add_argument("--close-mosaic", type=int, default=10,
+                        help="Disable mosaic for the final N epochs (0: keep it on)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Reproducible kernels (disables cuDNN benchmark autotuning)")
+    parser.add_argument("--compile", action="store_true",
+                        help="torch.compile the forward pass (mode=reduce-overhead)")
     
     args = parser.parse_args()
     
@@ -170,8 +580,15 @@ if __name__ == "__main__":
         name=args.name,
         device=args.device,
         workers=args.workers,
-        cache=args.cache,
-        pretrained=not args.no_pretrained
+        cache={'auto': None, 'none': False}.get(args.cache, args.cache),
+        pretrained=not args.no_pretrained,
+        amp=not args.no_amp,
+        compile_model=args.compile,
+        accumulate=args.accumulate,
+        deterministic=args.deterministic,
+        close_mosaic=args.close_mosaic,
+        save_period=args.save_period,
+        plots=args.plots
     )
     
     print(f"\n✓ Training complete! Best model: {best_model}")
@@ -6,9 +6,28 @@ Checks for common issues before training
 
 import os
 import sys
+import json
+import functools
+import warnings
 import yaml
+import numpy as np
 from pathlib import Path
-from glob import glob
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C bindings
+except ImportError:
+    from yaml import SafeLoader
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path, mtime):
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_yaml(path):
+    """Parse a YAML file, reusing the result within this process until the file changes"""
+    return _load_yaml(os.path.abspath(path), os.path.getmtime(path))
 
 
 def validate_yaml(yaml_path):
@@ -21,8 +40,7 @@ def validate_yaml(yaml_path):
         print(f"✗ Error: {yaml_path} not found")
         return False
     
-    with open(yaml_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(yaml_path)
     
     # Check required fields
     required_fields = ['path', 'train', 'val', 'nc', 'names']
@@ -74,20 +92,27 @@ def validate_paths(config):
     return paths_ok, train_path, val_path
 
 
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp'}
+
+
+def find_files(root_dir, extensions):
+    """List files under root_dir (recursive) whose lowercase suffix is in extensions"""
+    # Single tree walk instead of one glob per extension/case
+    return [os.path.join(root, name)
+            for root, _, names in os.walk(root_dir)
+            for name in names
+            if os.path.splitext(name)[1].lower() in extensions]
+
+
 def count_images(image_dir):
     """Count images in directory"""
-    extensions = ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.JPG', '*.JPEG', '*.PNG']
-    images = []
-    for ext in extensions:
-        images.extend(glob(os.path.join(image_dir, ext)))
-        images.extend(glob(os.path.join(image_dir, '**', ext), recursive=True))
+    images = find_files(image_dir, IMAGE_EXTENSIONS)
     return len(images), images
 
 
 def count_labels(label_dir):
     """Count label files"""
-    labels = glob(os.path.join(label_dir, '*.txt'))
-    labels.extend(glob(os.path.join(label_dir, '**', '*.txt'), recursive=True))
+    labels = find_files(label_dir, {'.txt'})
     return len(labels), labels
 
 
@@ -157,7 +182,7 @@ def validate_dataset_size(config, train_path, val_path):
         print(f"✗ Validation label directory not found: {val_label_dir}")
         return False
     
-    return True
+    return {'train_images': train_count, 'val_images': val_count}
 
 
 def sample_label_check(config, train_path):
@@ -167,8 +192,7 @@ def sample_label_check(config, train_path):
     print("=" * 80)
     
     train_label_dir = train_path.replace('images', 'labels')
-    labels = glob(os.path.join(train_label_dir, '*.txt'))
-    labels.extend(glob(os.path.join(train_label_dir, '**', '*.txt'), recursive=True))
+    _, labels = count_labels(train_label_dir)
     
     if not labels:
         print("✗ No labels found to sample")
@@ -223,7 +247,94 @@ def sample_label_check(config, train_path):
     return True
 
 
-def main(yaml_path='data.yaml'):
+VALIDATE_CACHE_FILE = '.validate_cache.json'
+
+
+def _label_stamp(label_dir):
+    """File count, newest mtime and total size of the label files (changes on in-place edits)"""
+    _, files = count_labels(label_dir)
+    stats = [os.stat(f) for f in files]
+    return [len(stats), max((st.st_mtime_ns for st in stats), default=0),
+            sum(st.st_size for st in stats)]
+
+
+def _cache_key(yaml_path, train_path, val_path):
+    """mtimes of data.yaml and the image/label directories (changes when files are added/removed)
+    plus a stamp of every label file, since the cached result covers the label contents too"""
+    label_dirs = [train_path.replace('images', 'labels'), val_path.replace('images', 'labels')]
+    paths = [yaml_path, train_path, val_path] + label_dirs
+    return ([os.path.getmtime(p) if os.path.exists(p) else None for p in paths]
+            + [_label_stamp(d) for d in label_dirs])
+
+
+def _load_cached_result(cache_path, key):
+    """Return the stored result if the cache exists and its key matches, else None"""
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached.get('result') if cached.get('key') == key else None
+
+
+def validate_all_labels(label_dir, nc):
+    """Check class IDs and bbox ranges of every label file with vectorized NumPy checks"""
+    print("\n" + "=" * 80)
+    print(f"Full Label Validation: {label_dir}")
+    print("=" * 80)
+    
+    _, files = count_labels(label_dir)
+    if not files:
+        print("✗ No labels found")
+        return False
+    
+    # Parse every file into one (N, 5) array, remembering which file each row came from
+    arrays, owners, bad_format = [], [], []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # empty label files (no objects) are valid
+        for i, label_file in enumerate(files):
+            try:
+                data = np.loadtxt(label_file, ndmin=2)
+            except ValueError:
+                bad_format.append(label_file)
+                continue
+            if data.size == 0:
+                continue
+            if data.shape[1] != 5:
+                bad_format.append(label_file)
+                continue
+            arrays.append(data)
+            owners.append(np.full(len(data), i))
+    
+    if bad_format:
+        print(f"✗ {len(bad_format)} file(s) not in 'class x y w h' format, e.g. {bad_format[0]}")
+    if not arrays:
+        print(f"  Files: {len(files)}, annotations: 0")
+        return not bad_format
+    
+    data = np.concatenate(arrays)
+    owners = np.concatenate(owners)
+    cls = data[:, 0]
+    bad_cls = (cls < 0) | (cls >= nc) | (cls != np.floor(cls))
+    bad_xy = ((data[:, 1:] < 0) | (data[:, 1:] > 1)).any(axis=1)
+    print(f"  Files: {len(files)}, annotations: {len(data)}")
+    
+    for name, bad in (("invalid class ID", bad_cls), ("coordinates out of range [0, 1]", bad_xy)):
+        rows = np.flatnonzero(bad)
+        if rows.size:
+            bad_files = np.unique(owners[rows])
+            print(f"✗ {rows.size} annotation(s) with {name} in {bad_files.size} file(s)")
+            for i in bad_files[:5]:
+                print(f"    - {files[i]}")
+    
+    if bad_format or bad_cls.any() or bad_xy.any():
+        return False
+    
+    print("✓ All labels valid")
+    return True
+
+
+def main(yaml_path='data.yaml', use_cache=True):
     """Run all validation checks"""
     print("\n" + "=" * 80)
     print("K230D YOLOv8n Dataset Validator")
@@ -241,16 +352,44 @@ def main(yaml_path='data.yaml'):
         print("\n✗ Validation failed: Invalid paths")
         return False
     
+    # Skip the full tree walk when nothing changed since the last successful run
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(yaml_path)), VALIDATE_CACHE_FILE)
+    cache_key = _cache_key(yaml_path, train_path, val_path)
+    cached = _load_cached_result(cache_path, cache_key) if use_cache else None
+    if cached is not None:
+        print("\n" + "=" * 80)
+        print("Validation Summary (cached)")
+        print("=" * 80)
+        print(f"\n✓ Dataset unchanged since last validation ({cache_path})")
+        print(f"  - Training images: {cached['train_images']}")
+        print(f"  - Validation images: {cached['val_images']}")
+        if not cached['labels_ok']:
+            print("⚠ Warning: Label format issues detected")
+        print("  Run with --no-cache to force a full re-validation")
+        return True
+    
     # Validate dataset size
-    if not validate_dataset_size(config, train_path, val_path):
+    sizes = validate_dataset_size(config, train_path, val_path)
+    if not sizes:
         print("\n✗ Validation failed: Dataset issues")
         return False
     
     # Sample label check
-    if not sample_label_check(config, train_path):
+    labels_ok = sample_label_check(config, train_path)
+    for image_path in (train_path, val_path):
+        labels_ok &= validate_all_labels(image_path.replace('images', 'labels'), config['nc'])
+    if not labels_ok:
         print("\n⚠ Warning: Label format issues detected")
         print("  Please verify your label files are in YOLO format")
     
+    # Remember the result for reruns on an unchanged dataset
+    result = dict(sizes, labels_ok=labels_ok)
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({'key': cache_key, 'result': result}, f)
+    except OSError as e:
+        print(f"⚠ Warning: Could not write validation cache: {e}")
+    
     # Summary
     print("\n" + "=" * 80)
     print("Validation Summary")
@@ -269,8 +408,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Validate YOLO dataset")
     parser.add_argument("--data", type=str, default="data.yaml",
                         help="Path to data.yaml")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Ignore {VALIDATE_CACHE_FILE} and re-validate the whole dataset")
     
     args = parser.parse_args()
     
-    success = main(args.data)
+    success = main(args.data, use_cache=not args.no_cache)
     sys.exit(0 if success else 1)